@@ -1,10 +1,18 @@
-from typing import Any, Text, Dict, List, Optional
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Text, Dict, Iterable, List, Optional, Tuple
 from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
+import bisect
+import functools
 import logging
 import re
-from difflib import get_close_matches
+import sys
+from difflib import SequenceMatcher
 from datetime import datetime
+try:
+    from rapidfuzz import process, fuzz
+except ImportError:
+    process = fuzz = None
 try:
     from zoneinfo import ZoneInfo
 except Exception:
@@ -39,6 +47,9 @@ TICKET_PRICES = {
     ("Warszawa", "Kraków"): "90 zł (standardowy)",
 }
 
+for (_a, _b), _price in list(TICKET_PRICES.items()):
+    TICKET_PRICES.setdefault((_b, _a), _price)
+
 PLATFORMS = {
     "IC 1234": "peron 5",
     "TLK 4567": "peron 2",
@@ -57,7 +68,27 @@ TRAIN_SERVICES = {
     "EIP 123": ["Wi-Fi", "restauracja", "przedziały 1 klasy"],
 }
 
-KNOWN_CITIES = sorted({c for pair in list(SCHEDULES.keys()) for c in pair} | set(DELAYS_CITY.keys()))
+def _intern_keys(table: Dict[Any, Any]) -> Dict[Any, Any]:
+    return {tuple(map(sys.intern, k)) if isinstance(k, tuple) else sys.intern(k): v for k, v in table.items()}
+
+SCHEDULES = _intern_keys(SCHEDULES)
+DELAYS_CITY = _intern_keys(DELAYS_CITY)
+DELAYS_TRAIN = _intern_keys(DELAYS_TRAIN)
+TICKET_PRICES = _intern_keys(TICKET_PRICES)
+PLATFORMS = _intern_keys(PLATFORMS)
+TRAIN_TYPES = _intern_keys(TRAIN_TYPES)
+TRAIN_SERVICES = _intern_keys(TRAIN_SERVICES)
+
+KNOWN_CITIES = tuple(sorted({c for pair in list(SCHEDULES.keys()) for c in pair} | set(DELAYS_CITY.keys())))
+
+KNOWN_CITIES_SET = frozenset(KNOWN_CITIES)
+
+_SCHEDULES_LOWER = {(a.lower(), b.lower()): (a, b) for a, b in SCHEDULES}
+_FROM_INDEX: Dict[str, List[Tuple[str, str]]] = {}
+_TO_INDEX: Dict[str, List[Tuple[str, str]]] = {}
+for _route in SCHEDULES:
+    _FROM_INDEX.setdefault(_route[0].lower(), []).append(_route)
+    _TO_INDEX.setdefault(_route[1].lower(), []).append(_route)
 
 CITY_ALIASES = {
     "Krakowa": "Kraków",
@@ -73,169 +104,257 @@ CITY_ALIASES = {
     "Poznania": "Poznań",
     "Poznań": "Poznań",
 }
-
+CITY_ALIASES = {sys.intern(k): sys.intern(v) for k, v in CITY_ALIASES.items()}
+
+def _fold_city(text: str) -> str:
+    return text.lower().replace("ł", "l")
+
+def _build_city_trie(entries: Dict[str, str]) -> Dict[str, Any]:
+    root: Dict[str, Any] = {}
+    for key, city in entries.items():
+        node = root
+        for ch in _fold_city(key):
+            node = node.setdefault(ch, {})
+        node[""] = city
+    return root
+
+def _trie_longest_prefix(trie: Dict[str, Any], text: str) -> Optional[str]:
+    node = trie
+    found = None
+    for ch in text:
+        node = node.get(ch)
+        if node is None:
+            break
+        found = node.get("", found)
+    return found
+
+_CITY_ENTRIES = {**{c: c for c in KNOWN_CITIES}, **CITY_ALIASES}
+_CITY_TRIE = _build_city_trie(_CITY_ENTRIES)
+_CITY_FOLDED = {_fold_city(k): v for k, v in _CITY_ENTRIES.items()}
+
+_NORMALIZE_RE = re.compile(r"[^\w\s\-\u0100-\u017F]")
+_TRAIN_RE = re.compile(r"([A-ZĄĆĘŁŃÓŚŻŹ]{1,4})\s*-?\s*(\d{1,5})")
+
+@functools.lru_cache(maxsize=2048)
 def normalize_text(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
     text = text.strip()
-    text = re.sub(r"[^\w\s\-\u0100-\u017F]", "", text)
+    text = _NORMALIZE_RE.sub("", text)
     return text
 
+def _get_close_match(word: str, possibilities: Tuple[str, ...], cutoff: float = 0.6) -> Optional[str]:
+    best = None
+    s = SequenceMatcher()
+    s.set_seq2(word)
+    for x in possibilities:
+        s.set_seq1(x)
+        if s.real_quick_ratio() < cutoff or s.quick_ratio() < cutoff:
+            continue
+        r = s.ratio()
+        if r >= cutoff and (best is None or (r, x) > best):
+            best = (r, x)
+    return best[1] if best else None
+
+@functools.lru_cache(maxsize=2048)
 def normalize_city(raw: Optional[str]) -> Optional[str]:
     if not raw:
         return None
     raw = raw.strip()
-    if raw in CITY_ALIASES:
-        return CITY_ALIASES[raw]
-    for k, v in CITY_ALIASES.items():
-        if k.lower() == raw.lower():
-            return v
-    candidates = get_close_matches(raw, KNOWN_CITIES, n=1, cutoff=0.6)
-    if candidates:
-        return candidates[0]
-    low = raw.lower().replace("ł", "l")
-    for k in KNOWN_CITIES:
-        if k.lower().replace("ł", "l") == low:
-            return k
+    if raw in KNOWN_CITIES_SET:
+        return sys.intern(raw)
+    folded = _fold_city(raw)
+    if folded in _CITY_FOLDED:
+        return _CITY_FOLDED[folded]
+    hit = _trie_longest_prefix(_CITY_TRIE, folded)
+    if hit:
+        return hit
+    if process:
+        match = process.extractOne(raw, KNOWN_CITIES, scorer=fuzz.ratio, score_cutoff=60)
+        if match:
+            return match[0]
+    else:
+        candidate = _get_close_match(raw, KNOWN_CITIES)
+        if candidate:
+            return candidate
     return raw.title()
 
+@functools.lru_cache(maxsize=2048)
+def _canon_city(raw: Optional[str]) -> Optional[str]:
+    return normalize_city(normalize_text(raw)) if raw else None
+
+@functools.lru_cache(maxsize=2048)
 def normalize_train_number(raw: Optional[str]) -> Optional[str]:
     if not raw:
         return None
     raw = raw.strip().upper()
-    m = re.match(r"([A-ZĄĆĘŁŃÓŚŻŹ]{1,4})\s*-?\s*(\d{1,5})", raw)
+    if not raw or not raw[0].isalpha() or not any(c.isdigit() for c in raw):
+        return raw
+    m = _TRAIN_RE.match(raw)
     if m:
-        return f"{m.group(1)} {m.group(2)}"
+        return sys.intern(f"{m.group(1)} {m.group(2)}")
     return raw
 
+_WARSAW_TZ = ZoneInfo("Europe/Warsaw") if ZoneInfo else None
+
 def now_warsaw():
-    if ZoneInfo:
-        tz = ZoneInfo("Europe/Warsaw")
-        return datetime.now(tz)
-    else:
-        return datetime.now()
+    return datetime.now(_WARSAW_TZ) if _WARSAW_TZ else datetime.now()
 
 def time_str_to_minutes(t: str) -> int:
-    h, m = map(int, t.split(":"))
-    return h * 60 + m
+    return int(t[:2]) * 60 + int(t[3:])
 
 def minutes_to_time_str(m: int) -> str:
     h = (m // 60) % 24
     mm = m % 60
     return f"{h:02d}:{mm:02d}"
 
-def find_next_train(trains: List[str]) -> Optional[str]:
-    if not trains:
+SCHEDULES_STR = {route: ", ".join(times) for route, times in SCHEDULES.items()}
+SCHEDULES_MIN = {route: sorted(time_str_to_minutes(t) for t in times) for route, times in SCHEDULES.items()}
+
+def find_next_train(mins: List[int]) -> Optional[str]:
+    if not mins:
         return None
     now = now_warsaw()
     current_min = now.hour * 60 + now.minute
-    mins = sorted([time_str_to_minutes(t) for t in trains])
-    for m in mins:
-        if m >= current_min:
-            return minutes_to_time_str(m)
-    return minutes_to_time_str(mins[0])
+    i = bisect.bisect_left(mins, current_min)
+    return minutes_to_time_str(mins[i] if i < len(mins) else mins[0])
+
+_NEXT_INTENTS = frozenset({"ask_schedule_next", "ask_schedule"})
+_ALL_INTENTS = frozenset({"ask_schedule_all", "ask_schedule_connection"})
+_DELAY_CITY_INTENTS = frozenset({"ask_delay_city", "ask_delay"})
+
+_SCHEDULE_SLOTS = {
+    "departure_city": "departure_city",
+    "arrival_city": "arrival_city",
+    "from_city": "departure_city",
+    "to_city": "arrival_city",
+}
+_ROUTE_SLOTS = {"departure_city": "departure_city", "arrival_city": "arrival_city"}
+_DELAY_SLOTS = {"delay_city": "delay_city", "train_number": "train_number"}
+_TRAIN_SLOTS = {"train_number": "train_number"}
+
+def _extract_entities(tracker: Tracker, entities: Iterable[Dict[Text, Any]], mapping: Dict[str, str]) -> Dict[str, Optional[str]]:
+    slots = {slot: tracker.get_slot(slot) for slot in mapping.values()}
+    for ent in entities:
+        slot = mapping.get(ent.get("entity"))
+        if slot and not slots[slot]:
+            slots[slot] = ent.get("value")
+    return slots
+
+_SLOT_NORMALIZERS: Dict[str, Callable[[Optional[str]], Optional[str]]] = {
+    "departure_city": _canon_city,
+    "arrival_city": _canon_city,
+    "delay_city": _canon_city,
+    "train_number": normalize_train_number,
+}
+
+class _LookupAction(Action, ABC):
+    ENTITIES: Dict[str, str] = {}
+    REQUIRED: Tuple[str, ...] = ()
+    MISSING_TEXT: Text = ""
+    TABLE: Dict[Any, Any] = {}
+    FOUND_TEXT: Text = ""
+    NOT_FOUND_TEXT: Text = ""
 
-class ActionShowSchedule(Action):
+    @abstractmethod
     def name(self) -> Text:
-        return "action_show_schedule"
+        pass
 
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        departure = tracker.get_slot("departure_city")
-        arrival = tracker.get_slot("arrival_city")
-        for ent in tracker.latest_message.get("entities", []) or []:
-            if ent.get("entity") == "departure_city" and not departure:
-                departure = ent.get("value")
-            if ent.get("entity") == "arrival_city" and not arrival:
-                arrival = ent.get("value")
-            if ent.get("entity") == "from_city" and not departure:
-                departure = ent.get("value")
-            if ent.get("entity") == "to_city" and not arrival:
-                arrival = ent.get("value")
-
-        departure = normalize_city(normalize_text(departure)) if departure else None
-        arrival = normalize_city(normalize_text(arrival)) if arrival else None
-
-        if not departure or not arrival:
-            dispatcher.utter_message(text="Podaj proszę miasto początkowe i docelowe (np. 'z Łodzi do Krakowa').")
+        msg = tracker.latest_message
+        slots = _extract_entities(tracker, msg.get("entities") or (), self.ENTITIES)
+        values = {slot: _SLOT_NORMALIZERS[slot](value) for slot, value in slots.items()}
+        if not all(values[slot] for slot in self.REQUIRED):
+            dispatcher.utter_message(text=self.MISSING_TEXT)
             return []
+        self._lookup(dispatcher, (msg.get("intent") or {}).get("name"), values)
+        return []
+
+    def _lookup(self, dispatcher: CollectingDispatcher, intent: Optional[Text], values: Dict[str, Optional[str]]) -> None:
+        key = tuple(values[slot] for slot in self.REQUIRED)
+        found = self.TABLE.get(key if len(key) > 1 else key[0])
+        if found:
+            dispatcher.utter_message(text=self.FOUND_TEXT.format(value=self._format(found), **values))
+        else:
+            dispatcher.utter_message(text=self.NOT_FOUND_TEXT.format(**values))
 
-        key = (departure, arrival)
-        if key not in SCHEDULES:
-            reverse = (arrival, departure)
-            if reverse in SCHEDULES:
+    def _format(self, found: Any) -> Text:
+        return found
+
+class ActionShowSchedule(_LookupAction):
+    ENTITIES = _SCHEDULE_SLOTS
+    REQUIRED = ("departure_city", "arrival_city")
+    MISSING_TEXT = "Podaj proszę miasto początkowe i docelowe (np. 'z Łodzi do Krakowa')."
+
+    def name(self) -> Text:
+        return "action_show_schedule"
+
+    def _lookup(self, dispatcher: CollectingDispatcher, intent: Optional[Text], values: Dict[str, Optional[str]]) -> None:
+        departure, arrival = values["departure_city"], values["arrival_city"]
+        departure_l, arrival_l = departure.lower(), arrival.lower()
+        key = _SCHEDULES_LOWER.get((departure_l, arrival_l))
+        if key is None:
+            if (arrival_l, departure_l) in _SCHEDULES_LOWER:
                 dispatcher.utter_message(text=(f"Rozkład jest dostępny w odwrotną stronę ({arrival} → {departure}). Czy o to chodziło?"))
-                return []
-            alternatives = [k for k in SCHEDULES.keys() if k[0].lower() == departure.lower() or k[1].lower() == arrival.lower()]
+                return
+            alternatives = _FROM_INDEX.get(departure_l, []) + _TO_INDEX.get(arrival_l, [])
             if alternatives:
                 sample = alternatives[0]
-                dispatcher.utter_message(text=(f"Nie mam rozkładu dla trasy {departure} → {arrival}, ale mam informacje dla trasy {sample[0]} → {sample[1]}: {', '.join(SCHEDULES[sample])}."))
+                dispatcher.utter_message(text=(f"Nie mam rozkładu dla trasy {departure} → {arrival}, ale mam informacje dla trasy {sample[0]} → {sample[1]}: {SCHEDULES_STR[sample]}."))
             else:
                 dispatcher.utter_message(text=f"Niestety nie mam rozkładu dla trasy {departure} → {arrival}.")
-            return []
+            return
 
-        trains = SCHEDULES[key]
-        intent = tracker.latest_message.get("intent", {}).get("name")
+        trains = SCHEDULES_STR[key]
 
-        if intent in ("ask_schedule_next", "ask_schedule"):
-            next_train = find_next_train(trains)
+        if intent in _NEXT_INTENTS:
+            next_train = find_next_train(SCHEDULES_MIN[key])
             dispatcher.utter_message(text=f"Najbliższy pociąg z {departure} do {arrival} odjeżdża o {next_train}.")
-        elif intent == "ask_schedule_all" or intent == "ask_schedule_connection":
-            dispatcher.utter_message(text=f"Wszystkie dostępne odjazdy z {departure} do {arrival}: {', '.join(trains)}.")
+        elif intent in _ALL_INTENTS:
+            dispatcher.utter_message(text=f"Wszystkie dostępne odjazdy z {departure} do {arrival}: {trains}.")
         else:
-            next_train = find_next_train(trains)
-            dispatcher.utter_message(text=(f"Połączenia z {departure} do {arrival}: {', '.join(trains)}. Najbliższy: {next_train}."))
-        return []
+            next_train = find_next_train(SCHEDULES_MIN[key])
+            dispatcher.utter_message(text=(f"Połączenia z {departure} do {arrival}: {trains}. Najbliższy: {next_train}."))
+
+class ActionShowDelay(_LookupAction):
+    ENTITIES = _DELAY_SLOTS
 
-class ActionShowDelay(Action):
     def name(self) -> Text:
         return "action_show_delay"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        intent = tracker.latest_message.get("intent", {}).get("name")
-        delay_city = tracker.get_slot("delay_city")
-        train_number = tracker.get_slot("train_number")
-        for ent in tracker.latest_message.get("entities", []) or []:
-            if ent.get("entity") == "delay_city" and not delay_city:
-                delay_city = ent.get("value")
-            if ent.get("entity") == "train_number" and not train_number:
-                train_number = ent.get("value")
-
-        delay_city = normalize_city(normalize_text(delay_city)) if delay_city else None
-        train_number = normalize_train_number(train_number) if train_number else None
-
-        if intent in ("ask_delay_city", "ask_delay"):
+    def _lookup(self, dispatcher: CollectingDispatcher, intent: Optional[Text], values: Dict[str, Optional[str]]) -> None:
+        delay_city, train_number = values["delay_city"], values["train_number"]
+
+        if intent in _DELAY_CITY_INTENTS:
             if not delay_city:
                 dispatcher.utter_message(text="Podaj proszę miasto, z którego chcesz sprawdzić opóźnienia (np. 'opóźnienia z Krakowa').")
-                return []
+                return
             info = DELAYS_CITY.get(delay_city)
             if info:
                 dispatcher.utter_message(text=f"Aktualne informacje dla {delay_city}: {info}.")
             else:
                 dispatcher.utter_message(text=f"Brak informacji o opóźnieniach w {delay_city}.")
-            return []
         elif intent == "ask_delay_train":
             if not train_number:
                 dispatcher.utter_message(text="Podaj proszę numer pociągu (np. 'IC 1234').")
-                return []
+                return
             info = DELAYS_TRAIN.get(train_number)
             if info:
                 dispatcher.utter_message(text=f"Pociąg {train_number}: {info}.")
             else:
                 dispatcher.utter_message(text=f"Brak informacji o opóźnieniach dla pociągu {train_number}.")
-            return []
         else:
             if delay_city:
                 info = DELAYS_CITY.get(delay_city)
                 if info:
                     dispatcher.utter_message(text=f"Aktualnie dla {delay_city}: {info}.")
-                    return []
+                    return
             if train_number:
                 info = DELAYS_TRAIN.get(train_number)
                 if info:
                     dispatcher.utter_message(text=f"Pociąg {train_number}: {info}.")
-                    return []
+                    return
             dispatcher.utter_message(text="Nie rozumiem — podaj proszę miasto lub numer pociągu, którego dotyczy zapytanie o opóźnienia.")
-            return []
 
 class ActionCheckSchedule(Action):
     def name(self) -> Text:
@@ -253,93 +372,49 @@ class ActionCheckSchedule(Action):
         dispatcher.utter_message(text=f"Najbliższy pociąg z {from_city} do {to_city} odjeżdża o 12:45 🚆")
         return []
 
-class ActionShowTicketPrice(Action):
+class ActionShowTicketPrice(_LookupAction):
+    ENTITIES = _ROUTE_SLOTS
+    REQUIRED = ("departure_city", "arrival_city")
+    MISSING_TEXT = "Podaj miasta początkowe i docelowe, np. 'ile kosztuje bilet z Łodzi do Krakowa'."
+    TABLE = TICKET_PRICES
+    FOUND_TEXT = "Cena biletu z {departure_city} do {arrival_city}: {value}."
+    NOT_FOUND_TEXT = "Brak danych o cenie biletu dla trasy {departure_city} → {arrival_city}. Możesz spróbować innych wariantów (np. różni przewoźnicy)."
+
     def name(self) -> Text:
         return "action_show_ticket_price"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        departure = tracker.get_slot("departure_city")
-        arrival = tracker.get_slot("arrival_city")
-        for ent in tracker.latest_message.get("entities", []) or []:
-            if ent.get("entity") == "departure_city" and not departure:
-                departure = ent.get("value")
-            if ent.get("entity") == "arrival_city" and not arrival:
-                arrival = ent.get("value")
-
-        departure = normalize_city(normalize_text(departure)) if departure else None
-        arrival = normalize_city(normalize_text(arrival)) if arrival else None
-
-        if not departure or not arrival:
-            dispatcher.utter_message(text="Podaj miasta początkowe i docelowe, np. 'ile kosztuje bilet z Łodzi do Krakowa'.")
-            return []
-
-        price = TICKET_PRICES.get((departure, arrival)) or TICKET_PRICES.get((arrival, departure))
-        if price:
-            dispatcher.utter_message(text=f"Cena biletu z {departure} do {arrival}: {price}.")
-        else:
-            dispatcher.utter_message(text=f"Brak danych o cenie biletu dla trasy {departure} → {arrival}. Możesz spróbować innych wariantów (np. różni przewoźnicy).")
-        return []
+class ActionShowPlatform(_LookupAction):
+    ENTITIES = _TRAIN_SLOTS
+    REQUIRED = ("train_number",)
+    MISSING_TEXT = "Podaj numer pociągu, np. 'IC 1234'."
+    TABLE = PLATFORMS
+    FOUND_TEXT = "Pociąg {train_number} odjeżdża z {value}."
+    NOT_FOUND_TEXT = "Brak danych o peronie dla pociągu {train_number}."
 
-class ActionShowPlatform(Action):
     def name(self) -> Text:
         return "action_show_platform"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        train_number = tracker.get_slot("train_number")
-        for ent in tracker.latest_message.get("entities", []) or []:
-            if ent.get("entity") == "train_number" and not train_number:
-                train_number = ent.get("value")
-        train_number = normalize_train_number(train_number) if train_number else None
-        if not train_number:
-            dispatcher.utter_message(text="Podaj numer pociągu, np. 'IC 1234'.")
-            return []
-        platform = PLATFORMS.get(train_number)
-        if platform:
-            dispatcher.utter_message(text=f"Pociąg {train_number} odjeżdża z {platform}.")
-        else:
-            dispatcher.utter_message(text=f"Brak danych o peronie dla pociągu {train_number}.")
-        return []
+class ActionShowTrainType(_LookupAction):
+    ENTITIES = _ROUTE_SLOTS
+    REQUIRED = ("departure_city", "arrival_city")
+    MISSING_TEXT = "Podaj miasta początkowe i docelowe, np. 'jaki typ pociągu z Łodzi do Krakowa'."
+    TABLE = TRAIN_TYPES
+    FOUND_TEXT = "Na trasie {departure_city} → {arrival_city} kursuje pociąg typu: {value}."
+    NOT_FOUND_TEXT = "Brak danych o typie pociągu na trasie {departure_city} → {arrival_city}."
 
-class ActionShowTrainType(Action):
     def name(self) -> Text:
         return "action_show_train_type"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        departure = tracker.get_slot("departure_city")
-        arrival = tracker.get_slot("arrival_city")
-        for ent in tracker.latest_message.get("entities", []) or []:
-            if ent.get("entity") == "departure_city" and not departure:
-                departure = ent.get("value")
-            if ent.get("entity") == "arrival_city" and not arrival:
-                arrival = ent.get("value")
-        departure = normalize_city(normalize_text(departure)) if departure else None
-        arrival = normalize_city(normalize_text(arrival)) if arrival else None
-        if not departure or not arrival:
-            dispatcher.utter_message(text="Podaj miasta początkowe i docelowe, np. 'jaki typ pociągu z Łodzi do Krakowa'.")
-            return []
-        train_type = TRAIN_TYPES.get((departure, arrival))
-        if train_type:
-            dispatcher.utter_message(text=f"Na trasie {departure} → {arrival} kursuje pociąg typu: {train_type}.")
-        else:
-            dispatcher.utter_message(text=f"Brak danych o typie pociągu na trasie {departure} → {arrival}.")
-        return []
+class ActionShowServices(_LookupAction):
+    ENTITIES = _TRAIN_SLOTS
+    REQUIRED = ("train_number",)
+    MISSING_TEXT = "Podaj numer pociągu, np. 'IC 1234', abym mógł sprawdzić usługi."
+    TABLE = TRAIN_SERVICES
+    FOUND_TEXT = "Pociąg {train_number} oferuje: {value}."
+    NOT_FOUND_TEXT = "Brak informacji o usługach w pociągu {train_number}."
 
-class ActionShowServices(Action):
     def name(self) -> Text:
         return "action_show_services"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        train_number = tracker.get_slot("train_number")
-        for ent in tracker.latest_message.get("entities", []) or []:
-            if ent.get("entity") == "train_number" and not train_number:
-                train_number = ent.get("value")
-        train_number = normalize_train_number(train_number) if train_number else None
-        if not train_number:
-            dispatcher.utter_message(text="Podaj numer pociągu, np. 'IC 1234', abym mógł sprawdzić usługi.")
-            return []
-        services = TRAIN_SERVICES.get(train_number, [])
-        if services:
-            dispatcher.utter_message(text=f"Pociąg {train_number} oferuje: {', '.join(services)}.")
-        else:
-            dispatcher.utter_message(text=f"Brak informacji o usługach w pociągu {train_number}.")
-        return []
\ No newline at end of file
+    def _format(self, found: Any) -> Text:
+        return ", ".join(found)